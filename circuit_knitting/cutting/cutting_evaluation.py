@@ -14,13 +14,14 @@
 from __future__ import annotations
 
 from typing import Any, NamedTuple
+from collections import defaultdict
 from collections.abc import Sequence
-from itertools import chain
 
 import numpy as np
 from qiskit.circuit import QuantumCircuit, ClassicalRegister
 from qiskit.quantum_info import PauliList
 from qiskit.primitives import BaseSampler, Sampler as TerraSampler
+from qiskit.providers import JobV1 as Job
 from qiskit_aer.primitives import Sampler as AerSampler
 from qiskit.result import QuasiDistribution
 
@@ -60,7 +61,10 @@ def execute_experiments(
             a :class:`~qiskit.quantum_info.PauliList` is expected; otherwise, a mapping
             from partition label to subobservables is expected.
         num_samples: The number of samples to draw from the quasiprobability distribution
-        samplers: Sampler(s) on which to run the sub-experiments.
+        samplers: Sampler(s) on which to run the sub-experiments. If a mapping from
+            partition label to sampler is passed, the same sampler may be used for
+            more than one partition, in which case it will receive the sub-experiments
+            of all those partitions in a single batch.
 
     Returns:
         - A 3D list of length-2 tuples holding the quasi-distributions and QPD bit information
@@ -74,7 +78,6 @@ def execute_experiments(
         ValueError: ``SingleQubitQPDGate``\ s are not supported in unseparable circuits.
         ValueError: The keys for the input dictionaries are not equivalent.
         ValueError: The input circuits may not contain any classical registers or bits.
-        ValueError: If multiple samplers are passed, each one must be unique.
     """
     if num_samples <= 0:
         raise ValueError("The number of requested samples must be positive.")
@@ -102,18 +105,6 @@ def execute_experiments(
                 "The keys for the circuits and samplers dicts should be equivalent."
             )
 
-    if isinstance(samplers, dict):
-        # Ensure that each sampler is unique
-        collision_dict: dict[int, str | int] = {}
-        for k, v in samplers.items():
-            if id(v) in collision_dict:
-                raise ValueError(
-                    "Currently, if a samplers dict is passed to execute_experiments(), "
-                    "then each sampler must be unique; however, subsystems "
-                    f"{collision_dict[id(v)]} and {k} were passed the same sampler."
-                )
-            collision_dict[id(v)] = k
-
     # Ensure input Samplers can handle mid-circuit measurements
     _validate_samplers(samplers)
 
@@ -135,17 +126,45 @@ def execute_experiments(
     else:
         samplers_by_partition = [samplers[key] for key in sorted(samplers.keys())]
 
-    # Run each partition's sub-experiments
-    quasi_dists_by_partition = [
-        _run_experiments_batch(
-            [sample[i] for sample in subexperiments],
-            samplers_by_partition[i],
+    # Group the partitions by sampler, so that each sampler receives all of its
+    # sub-experiments in a single call to run()
+    partitions_by_sampler: dict[int, list[int]] = defaultdict(list)
+    for i, sampler in enumerate(samplers_by_partition):
+        partitions_by_sampler[id(sampler)].append(i)
+
+    # Submit each sampler's sub-experiments.  All jobs are submitted before
+    # any results are requested, so the samplers can run concurrently.
+    jobs: list[tuple[list[int], Job, list[int]]] = []
+    for partition_ids in partitions_by_sampler.values():
+        experiments_flat = [
+            circ
+            for i in partition_ids
+            for sample in subexperiments
+            for circ in sample[i]
+        ]
+        job, num_qpd_bits_flat = _submit_experiments_batch(
+            experiments_flat, samplers_by_partition[partition_ids[0]]
         )
-        for i in range(num_partitions)
+        jobs.append((partition_ids, job, num_qpd_bits_flat))
+
+    # Wait on each job and split its results back out by partition
+    num_unique_samples = len(subexperiments)
+    quasi_dists_by_partition: list[list[list[tuple[QuasiDistribution, int]]]] = [
+        [] for _ in range(num_partitions)
     ]
+    for partition_ids, job, num_qpd_bits_flat in jobs:
+        quasi_dists_flat = job.result().quasi_dists
+        start = 0
+        for i in partition_ids:
+            stop = start + num_unique_samples * len(subexperiments[0][i])
+            quasi_dists_by_partition[i] = _reshape_experiments_batch(
+                quasi_dists_flat[start:stop],
+                num_qpd_bits_flat[start:stop],
+                num_unique_samples,
+            )
+            start = stop
 
     # Reformat the counts to match the shape of the input before returning
-    num_unique_samples = len(subexperiments)
     quasi_dists: list[list[list[tuple[dict[str, int], int]]]] = [
         [] for _ in range(num_unique_samples)
     ]
@@ -204,19 +223,14 @@ def _append_measurement_circuit(
     # Append the appropriate measurements to qc
     obs_creg = ClassicalRegister(len(cog.pauli_indices), name="observable_measurements")
     qc.add_register(obs_creg)
-    # Implement the necessary basis rotations and measurements, as
-    # in BackendEstimator._measurement_circuit().
-    genobs_x = cog.general_observable.x
-    genobs_z = cog.general_observable.z
-    for clbit, subqubit in enumerate(cog.pauli_indices):
-        # subqubit is the index of the qubit in the subsystem.
-        # actual_qubit is its index in the system of interest (if different).
-        actual_qubit = qubit_locations[subqubit]
-        if genobs_x[subqubit]:
-            if genobs_z[subqubit]:
-                qc.sdg(actual_qubit)
-            qc.h(actual_qubit)
-        qc.measure(actual_qubit, obs_creg[clbit])
+    # Implement the necessary basis rotations and measurements, which are
+    # constructed only once for each CommutingObservableGroup.
+    qc.compose(
+        cog.measurement_template,
+        qubits=list(qubit_locations),
+        clbits=list(obs_creg),
+        inplace=True,
+    )
 
     return qc
 
@@ -272,6 +286,10 @@ def _generate_cutting_experiments(
     subexperiments: list[list[list[QuantumCircuit]]] = []
     coefficients = []
     sampled_frequencies = []
+    # A subcircuit's sub-experiments depend only on its own map ids, which
+    # often repeat across samples of the joint distribution.  Cache them so
+    # that each one is only decomposed and measured once.
+    subexperiments_cache: dict[tuple[int, tuple[int, ...]], list[QuantumCircuit]] = {}
     for z, (map_ids, (redundancy, weight_type)) in enumerate(sorted_samples):
         subexperiments.append([])
         actual_coeff = np.prod(
@@ -286,28 +304,32 @@ def _generate_cutting_experiments(
             map_ids_tmp = map_ids
             if is_separated:
                 map_ids_tmp = tuple(map_ids[j] for j in subcirc_map_ids[i])
-            decomp_qc = decompose_qpd_instructions(
-                subcircuit, subcirc_qpd_gate_ids[i], map_ids_tmp
-            )
-            subexperiments[-1].append([])
-            so = subsystem_observables[label]
-            for j, cog in enumerate(so.groups):
-                meas_qc = _append_measurement_circuit(decomp_qc, cog)
-                subexperiments[-1][-1].append(meas_qc)
+            cache_key = (i, tuple(map_ids_tmp))
+            if cache_key not in subexperiments_cache:
+                decomp_qc = decompose_qpd_instructions(
+                    subcircuit, subcirc_qpd_gate_ids[i], map_ids_tmp
+                )
+                # decomp_qc is not used anywhere else, so the final group's
+                # measurements can be appended to it in place rather than to a copy
+                groups = subsystem_observables[label].groups
+                subexperiments_cache[cache_key] = [
+                    _append_measurement_circuit(
+                        decomp_qc, cog, inplace=(j == len(groups) - 1)
+                    )
+                    for j, cog in enumerate(groups)
+                ]
+            subexperiments[-1].append(subexperiments_cache[cache_key])
 
     return subexperiments, coefficients, sampled_frequencies
 
 
-def _run_experiments_batch(
-    subexperiments: Sequence[Sequence[QuantumCircuit]],
+def _submit_experiments_batch(
+    experiments_flat: Sequence[QuantumCircuit],
     sampler: BaseSampler,
-) -> list[list[tuple[QuasiDistribution, int]]]:
-    """Run subexperiments on the backend."""
+) -> tuple[Job, list[int]]:
+    """Submit subexperiments to the backend without waiting on the results."""
     num_qpd_bits_flat = []
 
-    # Run all the experiments in one big batch
-    experiments_flat = list(chain.from_iterable(subexperiments))
-
     for circ in experiments_flat:
         if (
             len(circ.cregs) != 2
@@ -323,30 +345,30 @@ def _run_experiments_batch(
 
         num_qpd_bits_flat.append(len(circ.cregs[0]))
 
-    # Run all of the batched experiments
-    quasi_dists_flat = sampler.run(experiments_flat).result().quasi_dists
+    # Submit all of the experiments in one big batch
+    job = sampler.run(experiments_flat)
+
+    return job, num_qpd_bits_flat
 
-    # Reshape the output data to match the input
-    if len(subexperiments) == 1:
-        quasi_dists_reshaped = np.array([quasi_dists_flat])
-        num_qpd_bits = np.array([num_qpd_bits_flat])
-    else:
-        # We manually build the shape tuple in second arg because it behaves strangely
-        # with QuantumCircuits in some versions. (e.g. passes local pytest but fails in tox env)
-        quasi_dists_reshaped = np.reshape(
-            quasi_dists_flat, (len(subexperiments), len(subexperiments[0]))
-        )
-        num_qpd_bits = np.reshape(
-            num_qpd_bits_flat, (len(subexperiments), len(subexperiments[0]))
-        )
 
-    # Create the counts tuples, which include the number of QPD measurement bits
-    quasi_dists: list[list[tuple[dict[str, float], int]]] = [
-        [] for _ in range(len(subexperiments))
+def _reshape_experiments_batch(
+    quasi_dists_flat: Sequence[QuasiDistribution],
+    num_qpd_bits_flat: Sequence[int],
+    num_samples: int,
+) -> list[list[tuple[QuasiDistribution, int]]]:
+    """Reshape a partition's flat results to (``num_samples``, ``num_commuting_observ_groups``)."""
+    # The results are laid out sample-major, with one entry per commuting
+    # observable group, so they can be sliced directly into their final shape.
+    num_groups = len(quasi_dists_flat) // num_samples
+    quasi_dists: list[list[tuple[QuasiDistribution, int]]] = [
+        list(
+            strict_zip(
+                quasi_dists_flat[i * num_groups : (i + 1) * num_groups],
+                num_qpd_bits_flat[i * num_groups : (i + 1) * num_groups],
+            )
+        )
+        for i in range(num_samples)
     ]
-    for i, sample in enumerate(quasi_dists_reshaped):
-        for j, prob_dict in enumerate(sample):
-            quasi_dists[i].append((prob_dict, num_qpd_bits[i][j]))
 
     return quasi_dists
 
@@ -408,34 +430,34 @@ def _get_bases(circuit: QuantumCircuit) -> tuple[list[QPDBasis], list[list[int]]
 def _validate_samplers(samplers: BaseSampler | dict[str | int, BaseSampler]) -> None:
     """Replace unsupported statevector-based Samplers with ExactSampler."""
     if isinstance(samplers, BaseSampler):
-        if (
-            isinstance(samplers, AerSampler)
-            and "shots" in samplers.options
-            and samplers.options.shots is None
-        ):
-            _aer_sampler_error()
-        elif isinstance(samplers, TerraSampler):
-            _terra_sampler_error()
+        _validate_sampler(samplers)
 
     elif isinstance(samplers, dict):
-        for key, sampler in samplers.items():
-            if (
-                isinstance(sampler, AerSampler)
-                and "shots" in sampler.options
-                and sampler.options.shots is None
-            ):
-                _aer_sampler_error()
-            elif isinstance(sampler, TerraSampler):
-                _terra_sampler_error()
-            elif isinstance(sampler, BaseSampler):
-                continue
-            else:
+        for sampler in samplers.values():
+            if not isinstance(sampler, BaseSampler):
                 _bad_samplers_error()
+            _validate_sampler(sampler)
 
     else:
         _bad_samplers_error()
 
 
+def _validate_sampler(sampler: BaseSampler) -> None:
+    """Ensure a single Sampler can handle mid-circuit measurements."""
+    # Samplers which declare support for mid-circuit measurements need no
+    # further inspection.
+    if getattr(sampler, "SUPPORTS_MID_CIRCUIT_MEASUREMENT", False):
+        return
+    if (
+        isinstance(sampler, AerSampler)
+        and "shots" in sampler.options
+        and sampler.options.shots is None
+    ):
+        _aer_sampler_error()
+    elif isinstance(sampler, TerraSampler):
+        _terra_sampler_error()
+
+
 def _aer_sampler_error() -> None:
     raise ValueError(
         "qiskit_aer.primitives.Sampler does not support mid-circuit measurements when shots is None. "
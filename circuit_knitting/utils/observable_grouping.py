@@ -27,8 +27,10 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
+from functools import cached_property
 
 import numpy as np
+from qiskit.circuit import QuantumCircuit
 from qiskit.quantum_info import Pauli, PauliList
 
 from .iteration import strict_zip
@@ -166,6 +168,35 @@ class CommutingObservableGroup:
         object.__setattr__(self, "pauli_indices", pauli_indices)
         object.__setattr__(self, "pauli_bitmasks", pauli_bitmasks)
 
+    @cached_property
+    def measurement_template(self) -> QuantumCircuit:
+        """Circuit which measures ``general_observable`` in the computational basis.
+
+        The circuit acts on ``general_observable.num_qubits`` qubits and has one
+        classical bit for each entry in ``pauli_indices``.  It performs the
+        necessary basis rotations, followed by a measurement of each
+        non-identity qubit, as in ``BackendEstimator._measurement_circuit()``.
+
+        The template is constructed once, the first time it is accessed, and must
+        not be modified.
+        """
+        pauli_indices = np.asarray(self.pauli_indices, dtype=int)
+        genobs_x = self.general_observable.x[pauli_indices]
+        genobs_z = self.general_observable.z[pauli_indices]
+        qc = QuantumCircuit(self.general_observable.num_qubits, len(pauli_indices))
+        # Y measurements need an Sdg followed by an H; X measurements need
+        # only an H.  The rotations are selected from the x/z bits all at
+        # once, so qubits measured in the Z basis are never visited.
+        sdg_qubits = pauli_indices[np.flatnonzero(genobs_x & genobs_z)].tolist()
+        h_qubits = pauli_indices[np.flatnonzero(genobs_x)].tolist()
+        if sdg_qubits:
+            qc.sdg(sdg_qubits)
+        if h_qubits:
+            qc.h(h_qubits)
+        if self.pauli_indices:
+            qc.measure(self.pauli_indices, list(range(len(self.pauli_indices))))
+        return qc
+
 
 class ObservableCollection:
     """Collection of observables organized for efficient taking of measurements.
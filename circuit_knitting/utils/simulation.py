@@ -24,7 +24,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Sequence
-from typing import Any
+from typing import Any, ClassVar
 
 import numpy as np
 from qiskit.circuit import QuantumCircuit
@@ -148,6 +148,12 @@ class ExactSampler(BaseSampler):
     - https://github.com/Qiskit/qiskit-aer/issues/1811
     """
 
+    #: Whether this sampler supports mid-circuit measurements.  Samplers which
+    #: set this to ``True`` are accepted by
+    #: :func:`~circuit_knitting.cutting.execute_experiments` without further
+    #: inspection.
+    SUPPORTS_MID_CIRCUIT_MEASUREMENT: ClassVar[bool] = True
+
     def _call(
         self,
         circuits: tuple[QuantumCircuit, ...],
@@ -10,15 +10,22 @@
 # that they have been altered from the originals.
 
 import pytest
-import unittest
+from unittest import mock
 
-from copy import deepcopy
+import numpy as np
 
+from qiskit.providers import Options
 from qiskit.quantum_info import Pauli, PauliList
 from qiskit.result import QuasiDistribution
-from qiskit.primitives import Sampler as TerraSampler
+from qiskit.primitives import BaseSampler, Estimator, Sampler as TerraSampler
 from qiskit_aer.primitives import Sampler as AerSampler
-from qiskit.circuit import QuantumCircuit, ClassicalRegister, CircuitInstruction, Clbit
+from qiskit.circuit import (
+    QuantumCircuit,
+    QuantumRegister,
+    ClassicalRegister,
+    CircuitInstruction,
+    Clbit,
+)
 from qiskit.circuit.library.standard_gates import XGate
 
 from circuit_knitting.utils.observable_grouping import CommutingObservableGroup
@@ -30,331 +37,484 @@ from circuit_knitting.cutting.qpd import (
 )
 from circuit_knitting.cutting.cutting_evaluation import (
     _append_measurement_circuit,
+    _generate_cutting_experiments,
     execute_experiments,
 )
 from circuit_knitting.cutting.qpd import WeightType
-from circuit_knitting.cutting import partition_problem
-
-
-class TestCuttingEvaluation(unittest.TestCase):
-    def setUp(self):
-        qc = QuantumCircuit(2)
-        qc.h(0)
-        qc.cx(0, 1)
-        self.qc0 = qc.copy()
-        qc.add_register(ClassicalRegister(1, name="qpd_measurements"))
-        self.qc1 = qc.copy()
-        qc.add_register(ClassicalRegister(2, name="observable_measurements"))
-        self.qc2 = qc
-
-        self.cog = CommutingObservableGroup(
-            Pauli("XZ"), list(PauliList(["IZ", "XI", "XZ"]))
+from circuit_knitting.cutting import partition_problem, reconstruct_expectation_values
+
+
+# Neither Pauli nor PauliList instances are mutated by the code under test, so
+# each is parsed once here and shared by all tests.
+_X = Pauli("X")
+_XZ = Pauli("XZ")
+_Z_LIST = PauliList(["Z"])
+_ZZ_LIST = PauliList(["ZZ"])
+_XX_LIST = PauliList(["XX"])
+_IZ_XI_XZ_LIST = PauliList(["IZ", "XI", "XZ"])
+
+# Expected quasi-distributions.  These are only ever compared against, so they
+# can be shared by all tests.
+_QD_1 = QuasiDistribution({1: 1.0})
+_QD_3 = QuasiDistribution({3: 1.0})
+
+# Registers are immutable, so they can likewise be shared between circuits.
+_QREG = QuantumRegister(2, name="q")
+_QPD_CREG = ClassicalRegister(1, name="qpd_measurements")
+_OBS_CREG = ClassicalRegister(2, name="observable_measurements")
+
+
+def _qpd_circuit():
+    circuit = QuantumCircuit(2)
+    circuit.append(
+        CircuitInstruction(
+            TwoQubitQPDGate(QPDBasis(maps=[([XGate()], [XGate()])], coeffs=[1.0])),
+            qubits=[0, 1],
         )
+    )
+    circuit[0].operation.basis_id = 0
+    return circuit
+
 
-        self.circuit = QuantumCircuit(2)
-        self.circuit.append(
-            CircuitInstruction(
-                TwoQubitQPDGate(QPDBasis(maps=[([XGate()], [XGate()])], coeffs=[1.0])),
-                qubits=[0, 1],
-            )
+def _separated_circuits():
+    circ1 = QuantumCircuit(1)
+    circ1.append(
+        CircuitInstruction(
+            SingleQubitQPDGate(
+                QPDBasis(maps=[([XGate()], [XGate()])], coeffs=[1.0]),
+                qubit_id=0,
+                label="cut_cx_0",
+            ),
+            qubits=[0],
         )
-        self.circuit[0].operation.basis_id = 0
-        self.observable = PauliList(["ZZ"])
-        self.sampler = ExactSampler()
-
-    def test_execute_experiments(self):
-        with self.subTest("Basic test"):
-            quasi_dists, coefficients = execute_experiments(
-                self.circuit, self.observable, num_samples=50, samplers=self.sampler
-            )
-            self.assertEqual([[[(QuasiDistribution({3: 1.0}), 0)]]], quasi_dists)
-            self.assertEqual([(1.0, WeightType.EXACT)], coefficients)
-        with self.subTest("Basic test with dicts"):
-            circ1 = QuantumCircuit(1)
-            circ1.append(
-                CircuitInstruction(
-                    SingleQubitQPDGate(
-                        QPDBasis(maps=[([XGate()], [XGate()])], coeffs=[1.0]),
-                        qubit_id=0,
-                        label="cut_cx_0",
-                    ),
-                    qubits=[0],
-                )
-            )
-            circ2 = QuantumCircuit(1)
-            circ2.append(
-                CircuitInstruction(
-                    SingleQubitQPDGate(
-                        QPDBasis(maps=[([XGate()], [XGate()])], coeffs=[1.0]),
-                        qubit_id=1,
-                        label="cut_cx_0",
-                    ),
-                    qubits=[0],
-                )
-            )
-            subcircuits = {"A": circ1, "B": circ2}
-            subobservables = {"A": PauliList(["Z"]), "B": PauliList(["Z"])}
-            quasi_dists, coefficients = execute_experiments(
-                subcircuits,
-                subobservables,
-                num_samples=50,
-                samplers={"A": self.sampler, "B": deepcopy(self.sampler)},
-            )
-            self.assertEqual(
-                [
-                    [
-                        [(QuasiDistribution({1: 1.0}), 0)],
-                        [(QuasiDistribution({1: 1.0}), 0)],
-                    ]
-                ],
-                quasi_dists,
-            )
-            self.assertEqual([(1.0, WeightType.EXACT)], coefficients)
-        with self.subTest("Terra/Aer samplers with dicts"):
-            circ1 = QuantumCircuit(1)
-            circ1.append(
-                CircuitInstruction(
-                    SingleQubitQPDGate(
-                        QPDBasis(maps=[([XGate()], [XGate()])], coeffs=[1.0]),
-                        qubit_id=0,
-                        label="cut_cx_0",
-                    ),
-                    qubits=[0],
-                )
-            )
-            circ2 = QuantumCircuit(1)
-            circ2.append(
-                CircuitInstruction(
-                    SingleQubitQPDGate(
-                        QPDBasis(maps=[([XGate()], [XGate()])], coeffs=[1.0]),
-                        qubit_id=1,
-                        label="cut_cx_0",
-                    ),
-                    qubits=[0],
-                )
-            )
-            subcircuits = {"A": circ1, "B": circ2}
-            subobservables = {"A": PauliList(["Z"]), "B": PauliList(["Z"])}
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    subcircuits,
-                    subobservables,
-                    num_samples=50,
-                    samplers={
-                        "A": TerraSampler(),
-                        "B": TerraSampler(),
-                    },
-                )
-            assert e_info.value.args[0] == (
-                "qiskit.primitives.Sampler does not support mid-circuit measurements. "
-                "Use circuit_knitting.utils.simulation.ExactSampler to generate exact "
-                "distributions for each subexperiment."
-            )
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    subcircuits,
-                    subobservables,
-                    num_samples=50,
-                    samplers={
-                        "A": AerSampler(run_options={"shots": None}),
-                        "B": AerSampler(run_options={"shots": None}),
-                    },
-                )
-            assert e_info.value.args[0] == (
-                "qiskit_aer.primitives.Sampler does not support mid-circuit measurements when shots is None. "
-                "Use circuit_knitting.utils.simulation.ExactSampler to generate exact distributions "
-                "for each subexperiment."
-            )
-        with self.subTest("Terra sampler"):
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    self.circuit,
-                    self.observable,
-                    num_samples=50,
-                    samplers=TerraSampler(),
-                )
-            assert e_info.value.args[0] == (
-                "qiskit.primitives.Sampler does not support mid-circuit measurements. "
-                "Use circuit_knitting.utils.simulation.ExactSampler to generate exact "
-                "distributions for each subexperiment."
-            )
-        with self.subTest("Aer sampler no shots"):
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    self.circuit,
-                    self.observable,
-                    num_samples=50,
-                    samplers=AerSampler(run_options={"shots": None}),
-                )
-            assert e_info.value.args[0] == (
-                "qiskit_aer.primitives.Sampler does not support mid-circuit measurements when shots is None. "
-                "Use circuit_knitting.utils.simulation.ExactSampler to generate exact distributions "
-                "for each subexperiment."
-            )
-        with self.subTest("Bad samplers"):
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    self.circuit, self.observable, num_samples=50, samplers=42
-                )
-            assert e_info.value.args[0] == (
-                "The samplers input argument must be either an instance of qiskit.primitives.BaseSampler "
-                "or a mapping from partition labels to qiskit.primitives.BaseSampler instances."
-            )
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    self.circuit, self.observable, num_samples=50, samplers={42: 42}
-                )
-            assert e_info.value.args[0] == (
-                "The samplers input argument must be either an instance of qiskit.primitives.BaseSampler "
-                "or a mapping from partition labels to qiskit.primitives.BaseSampler instances."
-            )
-        with self.subTest("Negative num-samples"):
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    self.circuit, self.observable, num_samples=-1, samplers=self.sampler
-                )
-            assert (
-                e_info.value.args[0]
-                == "The number of requested samples must be positive."
-            )
-        with self.subTest("Dict of non-unique samplers"):
-            qc = QuantumCircuit(2)
-            qc.x(0)
-            qc.cnot(0, 1)
-            subcircuits, _, subobservables = partition_problem(
-                circuit=qc, partition_labels="AB", observables=PauliList(["XX"])
-            )
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    subcircuits,
-                    subobservables,
-                    num_samples=10,
-                    samplers={"A": self.sampler, "B": self.sampler},
-                )
-            assert (
-                e_info.value.args[0]
-                == "Currently, if a samplers dict is passed to execute_experiments(), then each sampler must be unique; however, subsystems A and B were passed the same sampler."
-            )
-        with self.subTest("Incompatible inputs"):
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    {"A": self.circuit},
-                    self.observable,
-                    num_samples=100,
-                    samplers=self.sampler,
-                )
-            assert e_info.value.args[0] == (
-                "If a partition mapping (dict[label, subcircuit]) is passed as the circuits argument, a "
-                "partition mapping (dict[label, subobservables]) is expected as the subobservables argument."
-            )
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    self.circuit,
-                    {"A": self.observable},
-                    num_samples=100,
-                    samplers=self.sampler,
-                )
-            assert e_info.value.args[0] == (
-                "If a QuantumCircuit is passed as the circuits argument, a PauliList "
-                "is expected as the subobservables argument."
-            )
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    {"B": self.circuit},
-                    {"A": self.observable},
-                    num_samples=100,
-                    samplers=self.sampler,
-                )
-            assert (
-                e_info.value.args[0]
-                == "The keys for the circuits and observables dicts should be equivalent."
-            )
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    {"A": self.circuit},
-                    {"A": self.observable},
-                    num_samples=100,
-                    samplers={"B": self.sampler},
-                )
-            assert (
-                e_info.value.args[0]
-                == "The keys for the circuits and samplers dicts should be equivalent."
-            )
-        with self.subTest("Single qubit gate in QuantumCircuit input"):
-            circuit = QuantumCircuit(1)
-            circuit.append(
-                CircuitInstruction(
-                    SingleQubitQPDGate(
-                        QPDBasis(maps=[([XGate()],)], coeffs=[1.0]), qubit_id=0
-                    ),
-                    qubits=[0],
-                )
-            )
-            observable = PauliList(["Z"])
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    circuit,
-                    observable,
-                    num_samples=50,
-                    samplers=self.sampler,
-                )
-            assert (
-                e_info.value.args[0]
-                == "SingleQubitQPDGates are not supported in unseparable circuits."
-            )
-        with self.subTest("Classical regs on input"):
-            circuit = self.circuit.copy()
-            circuit.add_bits([Clbit()])
-            with pytest.raises(ValueError) as e_info:
-                execute_experiments(
-                    circuit,
-                    self.observable,
-                    num_samples=50,
-                    samplers=self.sampler,
-                )
-            assert (
-                e_info.value.args[0]
-                == "Circuits input to execute_experiments should contain no classical registers or bits."
-            )
-
-    def test_append_measurement_circuit(self):
-        qc = self.qc1.copy()
-        with self.subTest("In place"):
-            qcx = qc.copy()
-            assert _append_measurement_circuit(qcx, self.cog, inplace=True) is qcx
-        with self.subTest("Out of place"):
-            assert _append_measurement_circuit(qc, self.cog) is not qc
-        with self.subTest("Correct measurement circuit"):
-            qc2 = self.qc2.copy()
-            qc2.measure(0, 1)
-            qc2.h(1)
-            qc2.measure(1, 2)
-            assert _append_measurement_circuit(qc, self.cog) == qc2
-        with self.subTest("Mismatch between qubit_locations and number of qubits"):
-            with pytest.raises(ValueError) as e_info:
-                _append_measurement_circuit(qc, self.cog, qubit_locations=[0])
-            assert (
-                e_info.value.args[0]
-                == "qubit_locations has 1 element(s) but the observable(s) have 2 qubit(s)."
-            )
-        with self.subTest("Mismatched qubits, no qubit_locations provided"):
-            cog = CommutingObservableGroup(Pauli("X"), [Pauli("X")])
-            with pytest.raises(ValueError) as e_info:
-                _append_measurement_circuit(qc, cog)
-            assert (
-                e_info.value.args[0]
-                == "Quantum circuit qubit count (2) does not match qubit count of observable(s) (1).  Try providing `qubit_locations` explicitly."
-            )
-
-    def test_workflow_with_unused_qubits(self):
-        """Issue #218"""
-        qc = QuantumCircuit(2)
-        subcircuits, _, subobservables = partition_problem(
-            circuit=qc, partition_labels="AB", observables=PauliList(["XX"])
+    )
+    circ2 = QuantumCircuit(1)
+    circ2.append(
+        CircuitInstruction(
+            SingleQubitQPDGate(
+                QPDBasis(maps=[([XGate()], [XGate()])], coeffs=[1.0]),
+                qubit_id=1,
+                label="cut_cx_0",
+            ),
+            qubits=[0],
         )
-        execute_experiments(
+    )
+    subcircuits = {"A": circ1, "B": circ2}
+    subobservables = {"A": _Z_LIST, "B": _Z_LIST}
+    return subcircuits, subobservables
+
+
+def _single_qubit_qpd_circuit():
+    circuit = QuantumCircuit(1)
+    circuit.append(
+        CircuitInstruction(
+            SingleQubitQPDGate(QPDBasis(maps=[([XGate()],)], coeffs=[1.0]), qubit_id=0),
+            qubits=[0],
+        )
+    )
+    return circuit
+
+
+def _qpd_circuit_with_clbit():
+    circuit = _qpd_circuit()
+    circuit.add_bits([Clbit()])
+    return circuit
+
+
+def _mock_terra_sampler():
+    # Only the type of the sampler is inspected on this error path, so a
+    # spec'd mock suffices
+    return mock.MagicMock(spec=TerraSampler)
+
+
+def _mock_aer_sampler_no_shots():
+    # Only the type and shots option of the sampler are inspected on this
+    # error path, so there is no need to construct a simulator
+    sampler = mock.MagicMock(spec=AerSampler)
+    sampler.options = Options(shots=None)
+    return sampler
+
+
+class _FlaggedTerraSampler(TerraSampler):
+    # Only used with circuits that measure at the very end, which this sampler
+    # can run despite its type normally being rejected
+    SUPPORTS_MID_CIRCUIT_MEASUREMENT = True
+
+
+class _UnflaggedSampler(BaseSampler):
+    # Neither a Terra nor an Aer sampler, so it passes the type checks
+    SUPPORTS_MID_CIRCUIT_MEASUREMENT = False
+
+    _call = ExactSampler._call
+    _run = ExactSampler._run
+
+
+def _bell_circuit(*cregs):
+    """Build a Bell circuit whose registers are all allocated up front."""
+    qc = QuantumCircuit(_QREG, *cregs)
+    qc.h(0)
+    qc.cx(0, 1)
+    return qc
+
+
+@pytest.fixture
+def qc1():
+    return _bell_circuit(_QPD_CREG)
+
+
+@pytest.fixture
+def qc2():
+    return _bell_circuit(_QPD_CREG, _OBS_CREG)
+
+
+@pytest.fixture(scope="module")
+def cog():
+    return CommutingObservableGroup(_XZ, list(_IZ_XI_XZ_LIST))
+
+
+@pytest.fixture(scope="module")
+def observable():
+    return _ZZ_LIST
+
+
+@pytest.fixture(scope="module")
+def circuit():
+    # execute_experiments() decomposes a copy of its input, so the circuit can
+    # be shared by all tests
+    return _qpd_circuit()
+
+
+@pytest.fixture(scope="module")
+def sampler():
+    # ExactSampler holds no state between calls to run()
+    return ExactSampler()
+
+
+_TERRA_SAMPLER_ERROR = (
+    "qiskit.primitives.Sampler does not support mid-circuit measurements. "
+    "Use circuit_knitting.utils.simulation.ExactSampler to generate exact "
+    "distributions for each subexperiment."
+)
+_AER_SAMPLER_ERROR = (
+    "qiskit_aer.primitives.Sampler does not support mid-circuit measurements when shots is None. "
+    "Use circuit_knitting.utils.simulation.ExactSampler to generate exact distributions "
+    "for each subexperiment."
+)
+_BAD_SAMPLERS_ERROR = (
+    "The samplers input argument must be either an instance of qiskit.primitives.BaseSampler "
+    "or a mapping from partition labels to qiskit.primitives.BaseSampler instances."
+)
+
+
+def test_execute_experiments(circuit, observable, sampler):
+    quasi_dists, coefficients = execute_experiments(
+        circuit, observable, num_samples=50, samplers=sampler
+    )
+    assert quasi_dists == [[[(_QD_3, 0)]]]
+    assert coefficients == [(1.0, WeightType.EXACT)]
+
+
+def test_execute_experiments_with_dicts(sampler):
+    subcircuits, subobservables = _separated_circuits()
+    quasi_dists, coefficients = execute_experiments(
+        subcircuits,
+        subobservables,
+        num_samples=50,
+        samplers={"A": sampler, "B": ExactSampler()},
+    )
+    assert quasi_dists == [
+        [
+            [(_QD_1, 0)],
+            [(_QD_1, 0)],
+        ]
+    ]
+    assert coefficients == [(1.0, WeightType.EXACT)]
+
+
+def test_execute_experiments_with_non_unique_samplers(sampler):
+    qc = QuantumCircuit(2)
+    qc.x(0)
+    qc.cnot(0, 1)
+    subcircuits, _, subobservables = partition_problem(
+        circuit=qc, partition_labels="AB", observables=_XX_LIST
+    )
+    with mock.patch.object(sampler, "run", wraps=sampler.run) as run:
+        quasi_dists, coefficients = execute_experiments(
             subcircuits,
             subobservables,
-            num_samples=1,
-            samplers=AerSampler(),
+            num_samples=10,
+            samplers={"A": sampler, "B": sampler},
+        )
+    # The shared sampler receives the sub-experiments of both partitions in a
+    # single batch
+    assert run.call_count == 1
+    (circuits,) = run.call_args.args
+    subexperiments, _, _ = _generate_cutting_experiments(
+        subcircuits, subobservables, num_samples=10
+    )
+    assert list(circuits) == [
+        circ for i in range(2) for sample in subexperiments for circ in sample[i]
+    ]
+    expected_quasi_dists, expected_coefficients = execute_experiments(
+        subcircuits,
+        subobservables,
+        num_samples=10,
+        samplers={"A": sampler, "B": ExactSampler()},
+    )
+    assert quasi_dists == expected_quasi_dists
+    assert coefficients == expected_coefficients
+
+
+def test_execute_experiments_reuses_subexperiments_across_samples(sampler):
+    # With three partitions, the outer partitions each see only one of the two
+    # cuts, so their map ids repeat across samples of the joint distribution
+    qc = QuantumCircuit(3)
+    qc.ry(0.3, 0)
+    qc.ry(0.7, 1)
+    qc.rx(1.1, 2)
+    qc.cx(0, 1)
+    qc.cx(1, 2)
+    observables = PauliList(["ZZZ", "XIZ", "IYX"])
+    subcircuits, _, subobservables = partition_problem(
+        circuit=qc, partition_labels="ABC", observables=observables
+    )
+
+    subexperiments, _, _ = _generate_cutting_experiments(
+        subcircuits, subobservables, num_samples=np.inf
+    )
+    for i in (0, 2):
+        partition_experiments = [sample[i] for sample in subexperiments]
+        unique_experiments = {id(exps): exps for exps in partition_experiments}
+        assert len(unique_experiments) < len(partition_experiments)
+
+    quasi_dists, coefficients = execute_experiments(
+        subcircuits, subobservables, num_samples=np.inf, samplers=sampler
+    )
+    simulated_expvals = reconstruct_expectation_values(
+        quasi_dists, coefficients, subobservables
+    )
+    exact_expvals = (
+        Estimator().run([qc] * len(observables), list(observables)).result().values
+    )
+    assert np.allclose(exact_expvals, simulated_expvals, atol=1e-8)
+
+
+@pytest.mark.parametrize(
+    "circuits, subobservables, num_samples, samplers, expected_err",
+    [
+        pytest.param(
+            *_separated_circuits(),
+            50,
+            {"A": _mock_terra_sampler(), "B": _mock_terra_sampler()},
+            _TERRA_SAMPLER_ERROR,
+            id="Terra samplers with dicts",
+        ),
+        pytest.param(
+            *_separated_circuits(),
+            50,
+            {
+                "A": _mock_aer_sampler_no_shots(),
+                "B": _mock_aer_sampler_no_shots(),
+            },
+            _AER_SAMPLER_ERROR,
+            id="Aer samplers with dicts",
+        ),
+        pytest.param(
+            _qpd_circuit(),
+            _ZZ_LIST,
+            50,
+            _mock_terra_sampler(),
+            _TERRA_SAMPLER_ERROR,
+            id="Terra sampler",
+        ),
+        pytest.param(
+            _qpd_circuit(),
+            _ZZ_LIST,
+            50,
+            _mock_aer_sampler_no_shots(),
+            _AER_SAMPLER_ERROR,
+            id="Aer sampler no shots",
+        ),
+        pytest.param(
+            _qpd_circuit(),
+            _ZZ_LIST,
+            50,
+            42,
+            _BAD_SAMPLERS_ERROR,
+            id="Bad sampler",
+        ),
+        pytest.param(
+            _qpd_circuit(),
+            _ZZ_LIST,
+            50,
+            {42: 42},
+            _BAD_SAMPLERS_ERROR,
+            id="Bad samplers dict",
+        ),
+        pytest.param(
+            _qpd_circuit(),
+            _ZZ_LIST,
+            -1,
+            ExactSampler(),
+            "The number of requested samples must be positive.",
+            id="Negative num-samples",
+        ),
+        pytest.param(
+            {"A": _qpd_circuit()},
+            _ZZ_LIST,
+            100,
+            ExactSampler(),
+            "If a partition mapping (dict[label, subcircuit]) is passed as the circuits argument, a "
+            "partition mapping (dict[label, subobservables]) is expected as the subobservables argument.",
+            id="Circuits dict with observables PauliList",
+        ),
+        pytest.param(
+            _qpd_circuit(),
+            {"A": _ZZ_LIST},
+            100,
+            ExactSampler(),
+            "If a QuantumCircuit is passed as the circuits argument, a PauliList "
+            "is expected as the subobservables argument.",
+            id="Circuit with observables dict",
+        ),
+        pytest.param(
+            {"B": _qpd_circuit()},
+            {"A": _ZZ_LIST},
+            100,
+            ExactSampler(),
+            "The keys for the circuits and observables dicts should be equivalent.",
+            id="Mismatched circuits and observables keys",
+        ),
+        pytest.param(
+            {"A": _qpd_circuit()},
+            {"A": _ZZ_LIST},
+            100,
+            {"B": ExactSampler()},
+            "The keys for the circuits and samplers dicts should be equivalent.",
+            id="Mismatched circuits and samplers keys",
+        ),
+        pytest.param(
+            _single_qubit_qpd_circuit(),
+            _Z_LIST,
+            50,
+            ExactSampler(),
+            "SingleQubitQPDGates are not supported in unseparable circuits.",
+            id="Single qubit gate in QuantumCircuit input",
+        ),
+        pytest.param(
+            _qpd_circuit_with_clbit(),
+            _ZZ_LIST,
+            50,
+            ExactSampler(),
+            "Circuits input to execute_experiments should contain no classical registers or bits.",
+            id="Classical regs on input",
+        ),
+    ],
+)
+def test_execute_experiments_errors(
+    circuits, subobservables, num_samples, samplers, expected_err
+):
+    with pytest.raises(ValueError) as e_info:
+        execute_experiments(
+            circuits, subobservables, num_samples=num_samples, samplers=samplers
         )
+    assert e_info.value.args[0] == expected_err
+
+
+def test_execute_experiments_sampler_flag_precedes_type_checks(circuit, observable):
+    quasi_dists, coefficients = execute_experiments(
+        circuit, observable, num_samples=50, samplers=_FlaggedTerraSampler()
+    )
+    [[[(quasi_dist, num_qpd_bits)]]] = quasi_dists
+    assert quasi_dist.keys() == {3}
+    assert quasi_dist[3] == pytest.approx(1.0)
+    assert num_qpd_bits == 0
+    assert coefficients == [(1.0, WeightType.EXACT)]
+
+
+def test_execute_experiments_false_sampler_flag_falls_through(circuit, observable):
+    quasi_dists, coefficients = execute_experiments(
+        circuit, observable, num_samples=50, samplers=_UnflaggedSampler()
+    )
+    assert quasi_dists == [[[(_QD_3, 0)]]]
+    assert coefficients == [(1.0, WeightType.EXACT)]
+
+
+@pytest.mark.parametrize("flag", [None, False])
+@pytest.mark.parametrize(
+    "make_sampler, expected_err",
+    [
+        (_mock_terra_sampler, _TERRA_SAMPLER_ERROR),
+        (_mock_aer_sampler_no_shots, _AER_SAMPLER_ERROR),
+    ],
+)
+def test_execute_experiments_unflagged_samplers_rejected(
+    circuit, observable, make_sampler, expected_err, flag
+):
+    # Neither qiskit's nor qiskit-aer's sampler declares the flag
+    assert not hasattr(TerraSampler, "SUPPORTS_MID_CIRCUIT_MEASUREMENT")
+    assert not hasattr(AerSampler, "SUPPORTS_MID_CIRCUIT_MEASUREMENT")
+    sampler = make_sampler()
+    if flag is not None:
+        sampler.SUPPORTS_MID_CIRCUIT_MEASUREMENT = flag
+    with pytest.raises(ValueError) as e_info:
+        execute_experiments(circuit, observable, num_samples=50, samplers=sampler)
+    assert e_info.value.args[0] == expected_err
+
+
+def test_append_measurement_circuit_in_place(qc1, cog):
+    assert _append_measurement_circuit(qc1, cog, inplace=True) is qc1
+
+
+def test_append_measurement_circuit_out_of_place(qc1, cog):
+    assert _append_measurement_circuit(qc1, cog) is not qc1
+
+
+def test_append_measurement_circuit_correct(qc1, qc2, cog):
+    qc2.measure(0, 1)
+    qc2.h(1)
+    qc2.measure(1, 2)
+    assert _append_measurement_circuit(qc1, cog) == qc2
+
+
+def test_append_measurement_circuit_permuted_qubit_locations(qc1, qc2, cog):
+    # Observable qubit k lands on circuit qubit qubit_locations[k], and is
+    # measured into the clbit given by its position in pauli_indices
+    assert cog.pauli_indices == [0, 1]
+    qc2.measure(1, 1)
+    qc2.h(0)
+    qc2.measure(0, 2)
+    assert _append_measurement_circuit(qc1, cog, qubit_locations=[1, 0]) == qc2
+
+
+def test_append_measurement_circuit_qubit_locations_mismatch(qc1, cog):
+    with pytest.raises(ValueError) as e_info:
+        _append_measurement_circuit(qc1, cog, qubit_locations=[0])
+    assert (
+        e_info.value.args[0]
+        == "qubit_locations has 1 element(s) but the observable(s) have 2 qubit(s)."
+    )
+
+
+def test_append_measurement_circuit_qubit_count_mismatch(qc1):
+    cog = CommutingObservableGroup(_X, [_X])
+    with pytest.raises(ValueError) as e_info:
+        _append_measurement_circuit(qc1, cog)
+    assert (
+        e_info.value.args[0]
+        == "Quantum circuit qubit count (2) does not match qubit count of observable(s) (1).  Try providing `qubit_locations` explicitly."
+    )
+
+
+def test_workflow_with_unused_qubits():
+    """Issue #218"""
+    qc = QuantumCircuit(2)
+    subcircuits, _, subobservables = partition_problem(
+        circuit=qc, partition_labels="AB", observables=_XX_LIST
+    )
+    execute_experiments(
+        subcircuits,
+        subobservables,
+        num_samples=1,
+        samplers=AerSampler(),
+    )
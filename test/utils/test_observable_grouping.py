@@ -96,6 +96,23 @@ class TestEstimatorUtilities(unittest.TestCase):
             == "CommutingObservableGroup only supports Paulis with phase == 0. (Value provided: 3)"
         )
 
+    def test_cog_measurement_template(self):
+        with self.subTest("Correct measurement circuit"):
+            expected = QuantumCircuit(2, 2)
+            expected.measure(0, 0)
+            expected.h(1)
+            expected.measure(1, 1)
+            assert self.cog.measurement_template == expected
+        with self.subTest("Y measurement"):
+            cog = CommutingObservableGroup(Pauli("YI"), [Pauli("YI")])
+            expected = QuantumCircuit(2, 1)
+            expected.sdg(1)
+            expected.h(1)
+            expected.measure(1, 0)
+            assert cog.measurement_template == expected
+        with self.subTest("Cached"):
+            assert self.cog.measurement_template is self.cog.measurement_template
+
     def test_observable_collection(self):
         with self.subTest("Initialize with List[Pauli]"):
             oc = ObservableCollection([Pauli("XX"), Pauli("ZZ"), Pauli("XX")])